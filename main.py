@@ -1,12 +1,34 @@
+import asyncio
+import functools
 import json
 import os
+import queue
+import re
+import sys
+import threading
+import time
+from base64 import urlsafe_b64decode
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+import httplib2
+import httpx
+import orjson
+import requests
+from google.auth.exceptions import RefreshError
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.errors import HttpError
 from fastmcp import FastMCP
 from fastmcp.server.auth.providers.github import GitHubProvider
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Scopes - Gmail read-only, Calendar full access, Tasks full access
 SCOPES = [
@@ -24,6 +46,15 @@ ACCOUNTS = {
     "work": Path(__file__).parent / "token_work.json",
 }
 
+# Gmail rejects batch requests with more than 100 calls
+GMAIL_BATCH_SIZE = 100
+
+# Calendar never returns more than 2500 events per page, and may return fewer
+CALENDAR_PAGE_SIZE = 2500
+
+# Message bodies returned by gmail_read_thread are truncated to this many characters
+MAX_BODY_CHARS = 5000
+
 # Environment variable names for deployed tokens
 ENV_TOKENS = {
     "personal": "GOOGLE_TOKEN_PERSONAL",
@@ -32,12 +63,72 @@ ENV_TOKENS = {
 }
 
 
-def get_credentials(account: str = "personal") -> Credentials:
-    """Get or refresh Google credentials for a specific account."""
-    import sys
-    if account not in ACCOUNTS:
-        raise ValueError(f"Unknown account: {account}. Valid accounts: {list(ACCOUNTS.keys())}")
-
+# Responses worth retrying, with exponential backoff starting at RETRY_BACKOFF seconds
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+RETRY_BACKOFF = 0.3
+MAX_RETRIES = 3
+
+# HTTP/2 client shared by every API client, so concurrent calls multiplex over a few open connections
+_HTTP_CLIENT = httpx.Client(transport=httpx.HTTPTransport(
+    http2=True,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+    retries=MAX_RETRIES,  # connection failures only; status retries happen in PooledHttp
+))
+
+# google-auth refreshes tokens through requests, so it gets its own pooled session
+_POOLED_SESSION = requests.Session()
+_POOLED_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=MAX_RETRIES, backoff_factor=RETRY_BACKOFF, status_forcelist=RETRY_STATUSES, raise_on_status=False),
+))
+
+# Token refreshes reuse the pooled session instead of opening a new one each time
+_REFRESH_REQUEST = Request(session=_POOLED_SESSION)
+
+# Tokens this close to expiry are refreshed in the background while still being served
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
+_TOKEN_CACHE: dict[str, Credentials] = {}
+_REFRESH_LOCKS: dict[str, threading.Lock] = defaultdict(threading.Lock)
+
+# Local accounts whose token file was rejected by Google, so the next load re-runs the OAuth flow
+_REJECTED_TOKENS: set[str] = set()
+
+# Refreshed local tokens are written back by a single writer thread so tool calls never wait on disk
+_TOKEN_WRITES: queue.Queue = queue.Queue()
+
+def _save_token(account: str, token_json: str) -> None:
+    """Atomically replace an account's token file, so a crash mid-write never leaves it truncated."""
+    path = ACCOUNTS[account]
+    tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_text(token_json)
+        os.replace(tmp, path)
+    except OSError as e:
+        # Don't leave a partial copy of the refresh token lying around
+        tmp.unlink(missing_ok=True)
+        print(f"[DEBUG] Failed to save token for {account}: {e}", file=sys.stderr)
+
+def _token_writer():
+    while True:
+        _save_token(*_TOKEN_WRITES.get())
+
+_TOKEN_WRITER_LOCK = threading.Lock()
+_token_writer_thread = None
+
+def _queue_token_write(account: str, token_json: str) -> None:
+    """Queue a token to be saved, starting the writer thread on first use rather than at import."""
+    global _token_writer_thread
+    with _TOKEN_WRITER_LOCK:
+        if _token_writer_thread is None:
+            _token_writer_thread = threading.Thread(target=_token_writer, daemon=True)
+            _token_writer_thread.start()
+    _TOKEN_WRITES.put((account, token_json))
+
+
+def _load_credentials(account: str) -> Credentials:
+    """Load credentials for an account from its environment variable or token file, running the OAuth flow if needed."""
     creds = None
     is_deployed = os.environ.get("MCP_TRANSPORT") in ("sse", "http")
 
@@ -53,7 +144,7 @@ def get_credentials(account: str = "personal") -> Credentials:
             print(f"[DEBUG] Failed to parse token for {account}: {e}", file=sys.stderr)
             raise RuntimeError(f"Failed to parse token for {account}: {e}")
     # Fall back to file-based tokens (for local development)
-    elif not is_deployed and ACCOUNTS[account].exists():
+    elif not is_deployed and account not in _REJECTED_TOKENS and ACCOUNTS[account].exists():
         creds = Credentials.from_authorized_user_file(str(ACCOUNTS[account]), SCOPES)
 
     if not creds:
@@ -61,30 +152,164 @@ def get_credentials(account: str = "personal") -> Credentials:
             raise RuntimeError(f"No token found for {account}. Set {env_var} environment variable.")
         else:
             # Local development: run OAuth flow
-            print(f"Please authorize the {account} account in your browser...", file=__import__('sys').stderr)
+            print(f"Please authorize the {account} account in your browser...", file=sys.stderr)
             flow = InstalledAppFlow.from_client_secrets_file(str(CREDENTIALS_PATH), SCOPES)
             creds = flow.run_local_server(port=0)
-            ACCOUNTS[account].write_text(creds.to_json())
+            _REJECTED_TOKENS.discard(account)
+            # Save in the background so the new credentials can be used right away. Not a daemon
+            # thread, so the write still completes if the server exits first.
+            threading.Thread(target=_save_token, args=(account, creds.to_json())).start()
+
+    return creds
+
+
+def _refresh_credentials(account: str, creds: Credentials) -> None:
+    """Refresh credentials in place, queueing the new token to be saved for file-based accounts."""
+    if not creds.refresh_token:
+        raise RuntimeError(f"Token for {account} is invalid and has no refresh token.")
+    try:
+        creds.refresh(_REFRESH_REQUEST)
+    except RefreshError as e:
+        if e.retryable:
+            # Token endpoint throttled or failed (429/5xx); the stored token may still be fine, so keep it
+            raise RuntimeError(f"Failed to refresh token for {account}: {e}. This looks temporary; try again shortly.")
+        # The stored token was rejected; drop it and this account's clients so the next call reloads it
+        _TOKEN_CACHE.pop(account, None)
+        # Iterate a snapshot: other accounts may add clients concurrently under their own locks
+        for key in [key for key in list(_SERVICES) if key[2] == account]:
+            _SERVICES.pop(key, None)
+        if not os.environ.get(ENV_TOKENS[account]):
+            # Don't reload the same dead token file; run the OAuth flow instead
+            _REJECTED_TOKENS.add(account)
+        raise RuntimeError(f"Failed to refresh token for {account}: {e}. You may need to regenerate the token locally and update the environment variable.")
+    except Exception as e:
+        raise RuntimeError(f"Failed to refresh token for {account}: {e}. You may need to regenerate the token locally and update the environment variable.")
+    if not os.environ.get(ENV_TOKENS[account]):
+        _queue_token_write(account, creds.to_json())
+
+
+def _background_refresh(account: str, creds: Credentials, lock: threading.Lock) -> None:
+    try:
+        _refresh_credentials(account, creds)
+    except RuntimeError as e:
+        print(f"[DEBUG] Background refresh failed: {e}", file=sys.stderr)
+    finally:
+        lock.release()
+
+
+def get_credentials(account: str = "personal") -> Credentials:
+    """Get or refresh Google credentials for a specific account."""
+    if account not in ACCOUNTS:
+        raise ValueError(f"Unknown account: {account}. Valid accounts: {list(ACCOUNTS.keys())}")
+
+    lock = _REFRESH_LOCKS[account]
+    creds = _TOKEN_CACHE.get(account)
+    if creds is None:
+        with lock:
+            creds = _TOKEN_CACHE.get(account) or _load_credentials(account)
+            _TOKEN_CACHE[account] = creds
 
     if not creds.valid:
-        if creds.expired and creds.refresh_token:
-            try:
-                creds.refresh(Request())
-            except Exception as e:
-                raise RuntimeError(f"Failed to refresh token for {account}: {e}. You may need to regenerate the token locally and update the environment variable.")
-        else:
-            raise RuntimeError(f"Token for {account} is invalid and has no refresh token.")
+        # Expired: callers must wait, but only one of them performs the refresh
+        with lock:
+            if not creds.valid:
+                _refresh_credentials(account, creds)
+    elif creds.expiry and creds.refresh_token:
+        remaining = creds.expiry - datetime.now(timezone.utc).replace(tzinfo=None)
+        if remaining < TOKEN_REFRESH_MARGIN and lock.acquire(blocking=False):
+            # Still valid: keep serving it while a single background thread refreshes
+            threading.Thread(target=_background_refresh, args=(account, creds, lock), daemon=True).start()
 
     return creds
 
+class PooledHttp:
+    """Minimal httplib2.Http stand-in that sends requests through the shared HTTP/2 client."""
+
+    timeout = 60
+
+    def request(self, uri, method="GET", body=None, headers=None, redirections=httplib2.DEFAULT_MAX_REDIRECTS, connection_type=None, **kwargs):
+        for attempt in range(MAX_RETRIES + 1):
+            r = _HTTP_CLIENT.request(method, uri, content=body, headers=headers, timeout=self.timeout, follow_redirects=redirections > 0)
+            # Only idempotent requests are retried, so a batch or insert is never sent twice
+            if r.status_code not in RETRY_STATUSES or method not in ("GET", "HEAD", "PUT", "DELETE") or attempt == MAX_RETRIES:
+                break
+            time.sleep(RETRY_BACKOFF * 2 ** attempt)
+        response = httplib2.Response({"status": r.status_code, **r.headers})
+        # httpx already decompressed the body; mirror what httplib2 does with the headers
+        if "content-encoding" in response:
+            response["-content-encoding"] = response.pop("content-encoding")
+            response["content-length"] = str(len(r.content))
+        return response, r.content
+
+    def close(self):
+        pass
+
+@functools.cache
+def _discovery_document(api: str, version: str) -> dict:
+    """Load the discovery document bundled with googleapiclient, read and parsed once per API."""
+    doc = get_static_doc(api, version)
+    if doc is None:
+        raise ValueError(f"No bundled discovery document for {api} {version}")
+    return json.loads(doc)
+
+class AccountHttp(AuthorizedHttp):
+    """AuthorizedHttp whose token refreshes go through get_credentials and _refresh_credentials.
+
+    AuthorizedHttp would otherwise refresh on its own, outside the per-account lock,
+    without the pooled refresh session and without saving the new token. Its 401 retry
+    is replaced here for the same reason. The one path left is googleapiclient's batch
+    redo of 401 parts, which still refreshes the credentials directly.
+    """
+
+    def __init__(self, account: str):
+        super().__init__(get_credentials(account), http=PooledHttp(), refresh_status_codes=())
+        self.account = account
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        # Refreshes the cached token under the account lock if it has expired
+        self.credentials = get_credentials(self.account)
+        rejected_token = self.credentials.token
+        response, content = super().request(uri, method, body=body, headers=headers, **kwargs)
+        if response.status == 401:
+            with _REFRESH_LOCKS[self.account]:
+                # Only the first caller refreshes; the others pick up its new token
+                if self.credentials.token == rejected_token:
+                    _refresh_credentials(self.account, self.credentials)
+            response, content = super().request(uri, method, body=body, headers=headers, **kwargs)
+        return response, content
+
+def build_service(api: str, version: str, account: str = "personal"):
+    """Build a new API client for an account. Tools use the shared clients from get_service instead."""
+    http = AccountHttp(account)
+    # Unlike build(), build_from_document never touches googleapiclient's discovery cache
+    return build_from_document(_discovery_document(api, version), http=http)
+
+# Shared clients keyed by (api, version, account). The key space is small and closed, so nothing is evicted
+_SERVICES: dict[tuple[str, str, str], object] = {}
+
+# One lock per account so concurrent first calls don't build the same client twice
+_SERVICE_LOCKS = {account: threading.Lock() for account in ACCOUNTS}
+
+def get_service(api: str, version: str, account: str = "personal"):
+    """Get the shared API client for an account. Credentials refresh in place on the client's transport."""
+    if account not in ACCOUNTS:
+        raise ValueError(f"Unknown account: {account}. Valid accounts: {list(ACCOUNTS.keys())}")
+    # Keeps the shared credentials fresh; near expiry this starts a background refresh
+    get_credentials(account)
+    key = (api, version, account)
+    with _SERVICE_LOCKS[account]:
+        if key not in _SERVICES:
+            _SERVICES[key] = build_service(api, version, account)
+        return _SERVICES[key]
+
 def get_gmail(account: str = "personal"):
-    return build("gmail", "v1", credentials=get_credentials(account))
+    return get_service("gmail", "v1", account)
 
 def get_calendar(account: str = "personal"):
-    return build("calendar", "v3", credentials=get_credentials(account))
+    return get_service("calendar", "v3", account)
 
 def get_tasks(account: str = "personal"):
-    return build("tasks", "v1", credentials=get_credentials(account))
+    return get_service("tasks", "v1", account)
 
 # OAuth configuration for MCP server access
 MCP_OAUTH_CLIENT_ID = os.environ.get("MCP_OAUTH_CLIENT_ID")
@@ -102,22 +327,108 @@ if MCP_OAUTH_CLIENT_ID and MCP_OAUTH_CLIENT_SECRET:
 else:
     mcp = FastMCP("gmail-calendar-mcp")
 
+def threaded_tool(fn):
+    """Register a blocking tool as async, running it in a worker thread.
+
+    FastMCP calls sync tools directly on the event loop, so one slow Google API
+    call would otherwise stall every other request the server is handling.
+    """
+    @functools.wraps(fn)
+    async def run(*args, **kwargs):
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    return mcp.tool()(run)
+
+def _dump(obj) -> str:
+    """Serialize a tool result as indented JSON."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+# Shared pool for fanning a tool out across accounts or calendars. The pooled
+# HTTP transport is thread-safe, so workers can share the cached clients.
+_POOL = ThreadPoolExecutor(max_workers=8)
+
+# Prefetches the next page of a paginated list. Kept separate from _POOL because
+# _POOL workers wait on these tasks, which could otherwise exhaust the pool.
+_PAGE_POOL = ThreadPoolExecutor(max_workers=8)
+
+def _fan_out(fn, calls: dict) -> dict:
+    """Run fn(*args) for each key's args concurrently, returning results (or errors) in key order."""
+    futures = {_POOL.submit(fn, *args): key for key, args in calls.items()}
+    results = {}
+    for future in as_completed(futures):
+        try:
+            results[futures[future]] = future.result()
+        except Exception as e:
+            results[futures[future]] = {"error": str(e)}
+    return {key: results[key] for key in calls}
+
 # ============== Gmail Tools ==============
 
-@mcp.tool()
-def gmail_search(query: str, max_results: int = 10, account: str = "personal") -> str:
-    """Search Gmail messages. Use Gmail search syntax (e.g., 'from:someone@example.com', 'subject:hello', 'is:unread'). Account can be 'personal' or 'school'."""
+SEARCH_HEADERS = frozenset(("From", "Subject", "Date"))
+THREAD_HEADERS = frozenset(("From", "To", "Subject", "Date"))
+
+def _pick_headers(headers: list, wanted: frozenset) -> dict:
+    """Collect the wanted message headers, stopping once all of them are found."""
+    found = {}
+    for h in headers:
+        if h["name"] in wanted:
+            found[h["name"]] = h["value"]
+            if len(found) == len(wanted):
+                break
+    return found
+
+def _metadata_request(gmail, message_id: str):
+    return gmail.users().messages().get(userId="me", id=message_id, format="metadata", metadataHeaders=list(SEARCH_HEADERS), fields="id,threadId,snippet,payload/headers")
+
+
+def _get_message_metadata(gmail, message_ids: list[str]) -> dict:
+    """Fetch metadata for many messages using Gmail batch requests, retrying throttled or failed calls in parallel."""
+    details = {}
+    failed = []
+
+    def collect(request_id, response, exception):
+        if exception is None:
+            details[request_id] = response
+        elif isinstance(exception, HttpError) and exception.resp.status in RETRY_STATUSES:
+            failed.append(request_id)
+        else:
+            raise exception
+
+    for i in range(0, len(message_ids), GMAIL_BATCH_SIZE):
+        chunk = message_ids[i:i + GMAIL_BATCH_SIZE]
+        batch = gmail.new_batch_http_request(callback=collect)
+        for message_id in chunk:
+            batch.add(_metadata_request(gmail, message_id), request_id=message_id)
+        try:
+            batch.execute()
+        except HttpError as e:
+            if e.resp.status not in RETRY_STATUSES:
+                raise
+            failed.extend(m for m in chunk if m not in details and m not in failed)
+
+    if failed:
+        def fetch(message_id):
+            return message_id, _metadata_request(gmail, message_id).execute()
+
+        with ThreadPoolExecutor(max_workers=min(8, len(failed))) as pool:
+            details.update(pool.map(fetch, failed))
+
+    return details
+
+
+def _search_messages(query: str, max_results: int, account: str) -> list:
     gmail = get_gmail(account)
-    results = gmail.users().messages().list(userId="me", q=query, maxResults=max_results).execute()
+    results = gmail.users().messages().list(userId="me", q=query, maxResults=max_results, fields="messages(id,threadId)").execute()
     messages = results.get("messages", [])
     
     if not messages:
-        return "No messages found."
+        return []
     
+    details = _get_message_metadata(gmail, [msg["id"] for msg in messages])
+
     output = []
     for msg in messages:
-        detail = gmail.users().messages().get(userId="me", id=msg["id"], format="metadata", metadataHeaders=["From", "Subject", "Date"]).execute()
-        headers = {h["name"]: h["value"] for h in detail.get("payload", {}).get("headers", [])}
+        detail = details.get(msg["id"], {})
+        headers = _pick_headers(detail.get("payload", {}).get("headers", []), SEARCH_HEADERS)
         output.append({
             "id": msg["id"],
             "threadId": msg["threadId"],
@@ -127,30 +438,59 @@ def gmail_search(query: str, max_results: int = 10, account: str = "personal") -
             "snippet": detail.get("snippet", "")
         })
     
-    return json.dumps(output, indent=2)
+    return output
+
+
+@threaded_tool
+def gmail_search(query: str, max_results: int = 10, account: str = "personal") -> str:
+    """Search Gmail messages. Use Gmail search syntax (e.g., 'from:someone@example.com', 'subject:hello', 'is:unread'). Account can be 'personal' or 'school'."""
+    output = _search_messages(query, max_results, account)
+    if not output:
+        return "No messages found."
+    return _dump(output)
+
+
+@threaded_tool
+def gmail_search_multi(query: str, accounts: list[str] = None, max_results: int = 10) -> str:
+    """Search Gmail messages in several accounts at once, returning results keyed by account. Uses Gmail search syntax. If no accounts are given, searches every account that already has a token."""
+    # Defaulting to accounts without a token would start interactive OAuth flows inside the pool
+    if not accounts:
+        accounts = [a for a in ACCOUNTS if _has_token(a)]
+    return _dump(_fan_out(_search_messages, {a: (query, max_results, a) for a in accounts}))
+
 
+def _decode_body(data: str) -> str:
+    """Decode a base64url message body, truncated to MAX_BODY_CHARS.
 
-@mcp.tool()
+    Only the prefix that can hold MAX_BODY_CHARS characters (at most 4 UTF-8 bytes each)
+    is decoded, so long bodies are never decoded in full.
+    """
+    max_bytes = MAX_BODY_CHARS * 4
+    prefix = data[:(max_bytes + 2) // 3 * 4]
+    return urlsafe_b64decode(prefix).decode("utf-8", errors="ignore")[:MAX_BODY_CHARS]
+
+
+@threaded_tool
 def gmail_read_thread(thread_id: str, account: str = "personal") -> str:
     """Read a full Gmail thread by ID. Account can be 'personal' or 'school'."""
     gmail = get_gmail(account)
-    thread = gmail.users().threads().get(userId="me", id=thread_id, format="full").execute()
+    thread = gmail.users().threads().get(userId="me", id=thread_id, format="full", fields="messages(id,payload(headers,body/data,parts(mimeType,body(data,attachmentId))))").execute()
     
     messages = []
     for msg in thread.get("messages", []):
-        headers = {h["name"]: h["value"] for h in msg.get("payload", {}).get("headers", [])}
+        headers = _pick_headers(msg.get("payload", {}).get("headers", []), THREAD_HEADERS)
         
         # Extract body
         body = ""
         payload = msg.get("payload", {})
         if "body" in payload and payload["body"].get("data"):
-            import base64
-            body = base64.urlsafe_b64decode(payload["body"]["data"]).decode("utf-8", errors="ignore")
+            body = _decode_body(payload["body"]["data"])
         elif "parts" in payload:
             for part in payload["parts"]:
+                if part.get("body", {}).get("attachmentId"):
+                    continue
                 if part.get("mimeType") == "text/plain" and part.get("body", {}).get("data"):
-                    import base64
-                    body = base64.urlsafe_b64decode(part["body"]["data"]).decode("utf-8", errors="ignore")
+                    body = _decode_body(part["body"]["data"])
                     break
         
         messages.append({
@@ -159,26 +499,34 @@ def gmail_read_thread(thread_id: str, account: str = "personal") -> str:
             "to": headers.get("To", ""),
             "subject": headers.get("Subject", ""),
             "date": headers.get("Date", ""),
-            "body": body[:5000]  # Truncate long bodies
+            "body": body
         })
     
-    return json.dumps(messages, indent=2)
+    return _dump(messages)
 
 
-@mcp.tool()
+@threaded_tool
 def gmail_get_profile(account: str = "personal") -> str:
     """Get the authenticated user's Gmail profile. Account can be 'personal' or 'school'."""
     gmail = get_gmail(account)
     profile = gmail.users().getProfile(userId="me").execute()
-    return json.dumps(profile, indent=2)
+    return _dump(profile)
 
 # ============== Calendar Tools ==============
 
-@mcp.tool()
+# All-day events use a bare 'YYYY-MM-DD' date
+_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+def _time_spec(value: str, timezone: str) -> dict:
+    """Build an event start/end, using 'date' for all-day values and 'dateTime' otherwise."""
+    key = "date" if _DATE_RE.fullmatch(value) else "dateTime"
+    return {key: value, "timeZone": timezone}
+
+@threaded_tool
 def calendar_list(account: str = "personal") -> str:
     """List all calendars the user has access to. Account can be 'personal' or 'school'."""
     cal = get_calendar(account)
-    results = cal.calendarList().list().execute()
+    results = cal.calendarList().list(fields="items(id,summary,accessRole,primary)").execute()
     calendars = results.get("items", [])
     
     output = []
@@ -190,26 +538,42 @@ def calendar_list(account: str = "personal") -> str:
             "primary": c.get("primary", False)
         })
     
-    return json.dumps(output, indent=2)
-
-
-@mcp.tool()
-def calendar_list_events(
-    calendar_id: str = "primary",
-    time_min: str = None,
-    time_max: str = None,
-    max_results: int = 25,
-    query: str = None,
-    account: str = "personal"
-) -> str:
-    """List events from a calendar. time_min and time_max should be RFC3339 format (e.g., '2025-01-20T00:00:00Z'). Account can be 'personal' or 'school'."""
+    return _dump(output)
+
+
+@dataclass(slots=True)
+class ListedEvent:
+    """Event fields returned by the event listing tools. orjson serializes it directly."""
+    id: str
+    summary: str
+    start: str
+    end: str
+    location: str
+    description: str
+
+    @classmethod
+    def from_event(cls, e: dict) -> "ListedEvent":
+        start = e.get("start", {})
+        end = e.get("end", {})
+        return cls(
+            e["id"],
+            e.get("summary", "(No title)"),
+            start.get("dateTime") or start.get("date"),
+            end.get("dateTime") or end.get("date"),
+            e.get("location", ""),
+            e.get("description", "")[:500] if e.get("description") else "",
+        )
+
+
+def _list_events(calendar_id: str, time_min: str, time_max: str, max_results: int, query: str, account: str) -> list[ListedEvent]:
     cal = get_calendar(account)
     
     kwargs = {
         "calendarId": calendar_id,
-        "maxResults": max_results,
+        "maxResults": min(max_results, CALENDAR_PAGE_SIZE),
         "singleEvents": True,
-        "orderBy": "startTime"
+        "orderBy": "startTime",
+        "fields": "nextPageToken,items(id,summary,start,end,location,description)"
     }
     if time_min:
         kwargs["timeMin"] = time_min
@@ -218,24 +582,56 @@ def calendar_list_events(
     if query:
         kwargs["q"] = query
     
-    results = cal.events().list(**kwargs).execute()
-    events = results.get("items", [])
+    events = cal.events()
+    request = events.list(**kwargs)
+    results = request.execute()
     
     output = []
-    for e in events:
-        output.append({
-            "id": e["id"],
-            "summary": e.get("summary", "(No title)"),
-            "start": e.get("start", {}).get("dateTime") or e.get("start", {}).get("date"),
-            "end": e.get("end", {}).get("dateTime") or e.get("end", {}).get("date"),
-            "location": e.get("location", ""),
-            "description": e.get("description", "")[:500] if e.get("description") else ""
-        })
+    while True:
+        events_page = results.get("items", [])[:max_results - len(output)]
+        # Start fetching the next page before processing this one
+        pending = None
+        if len(output) + len(events_page) < max_results:
+            request = events.list_next(request, results)
+            if request is not None:
+                pending = _PAGE_POOL.submit(request.execute)
+        
+        output += [ListedEvent.from_event(e) for e in events_page]
+        
+        if pending is None:
+            break
+        results = pending.result()
     
-    return json.dumps(output, indent=2)
+    return output
+
+
+@threaded_tool
+def calendar_list_events(
+    calendar_id: str = "primary",
+    time_min: str = None,
+    time_max: str = None,
+    max_results: int = 25,
+    query: str = None,
+    account: str = "personal"
+) -> str:
+    """List events from a calendar. time_min and time_max should be RFC3339 format (e.g., '2025-01-20T00:00:00Z'). Account can be 'personal' or 'school'."""
+    return _dump(_list_events(calendar_id, time_min, time_max, max_results, query, account))
 
 
-@mcp.tool()
+@threaded_tool
+def calendar_list_events_multi(
+    calendar_ids: list[str],
+    time_min: str = None,
+    time_max: str = None,
+    max_results: int = 25,
+    query: str = None,
+    account: str = "personal"
+) -> str:
+    """List events from several calendars at once, returning results keyed by calendar ID. time_min and time_max should be RFC3339 format (e.g., '2025-01-20T00:00:00Z'). Account can be 'personal' or 'school'."""
+    return _dump(_fan_out(_list_events, {c: (c, time_min, time_max, max_results, query, account) for c in calendar_ids}))
+
+
+@threaded_tool
 def calendar_create_event(
     summary: str,
     start: str,
@@ -249,24 +645,21 @@ def calendar_create_event(
     """Create a calendar event. start and end should be RFC3339 format (e.g., '2025-01-20T10:00:00') or date format for all-day events ('2025-01-20'). Account can be 'personal' or 'school'."""
     cal = get_calendar(account)
     
-    # Determine if all-day event
-    is_all_day = len(start) == 10  # 'YYYY-MM-DD' format
-    
     event = {
         "summary": summary,
-        "start": {"date": start, "timeZone": timezone} if is_all_day else {"dateTime": start, "timeZone": timezone},
-        "end": {"date": end, "timeZone": timezone} if is_all_day else {"dateTime": end, "timeZone": timezone},
+        "start": _time_spec(start, timezone),
+        "end": _time_spec(end, timezone),
     }
     if description:
         event["description"] = description
     if location:
         event["location"] = location
     
-    result = cal.events().insert(calendarId=calendar_id, body=event).execute()
-    return json.dumps({"id": result["id"], "htmlLink": result.get("htmlLink", "")}, indent=2)
+    result = cal.events().insert(calendarId=calendar_id, body=event, fields="id,htmlLink").execute()
+    return _dump({"id": result["id"], "htmlLink": result.get("htmlLink", "")})
 
 
-@mcp.tool()
+@threaded_tool
 def calendar_update_event(
     event_id: str,
     calendar_id: str = "primary",
@@ -279,39 +672,38 @@ def calendar_update_event(
     account: str = "personal"
 ) -> str:
     """Update an existing calendar event. Only provided fields will be updated. Account can be 'personal' or 'school'."""
-    cal = get_calendar(account)
-    
-    # Get existing event
-    event = cal.events().get(calendarId=calendar_id, eventId=event_id).execute()
-    
+    # Patch only the provided fields, so there is no need to fetch the event first
+    event = {}
     if summary:
         event["summary"] = summary
     if description is not None:
         event["description"] = description
     if location is not None:
         event["location"] = location
+    # Patches merge nested objects, so clear the other of date/dateTime when switching between all-day and timed
     if start:
-        is_all_day = len(start) == 10
-        event["start"] = {"date": start, "timeZone": timezone} if is_all_day else {"dateTime": start, "timeZone": timezone}
+        event["start"] = {"date": None, "dateTime": None} | _time_spec(start, timezone)
     if end:
-        is_all_day = len(end) == 10
-        event["end"] = {"date": end, "timeZone": timezone} if is_all_day else {"dateTime": end, "timeZone": timezone}
+        event["end"] = {"date": None, "dateTime": None} | _time_spec(end, timezone)
+    if not event:
+        raise ValueError("Nothing to update: provide at least one of summary, start, end, description or location.")
     
-    result = cal.events().update(calendarId=calendar_id, eventId=event_id, body=event).execute()
-    return json.dumps({"id": result["id"], "updated": result.get("updated", "")}, indent=2)
+    cal = get_calendar(account)
+    result = cal.events().patch(calendarId=calendar_id, eventId=event_id, body=event, fields="id,updated").execute()
+    return _dump({"id": result["id"], "updated": result.get("updated", "")})
 
 
-@mcp.tool()
+@threaded_tool
 def calendar_delete_event(event_id: str, calendar_id: str = "primary", account: str = "personal") -> str:
     """Delete a calendar event. Account can be 'personal' or 'school'."""
     cal = get_calendar(account)
     cal.events().delete(calendarId=calendar_id, eventId=event_id).execute()
-    return json.dumps({"deleted": True, "event_id": event_id})
+    return _dump({"deleted": True, "event_id": event_id})
 
 
 # ============== Tasks Tools ==============
 
-@mcp.tool()
+@threaded_tool
 def tasks_list_tasklists(account: str = "personal") -> str:
     """List all task lists for the user. Account can be 'personal', 'school', or 'work'."""
     tasks = get_tasks(account)
@@ -326,10 +718,10 @@ def tasks_list_tasklists(account: str = "personal") -> str:
             "updated": tl.get("updated", "")
         })
 
-    return json.dumps(output, indent=2)
+    return _dump(output)
 
 
-@mcp.tool()
+@threaded_tool
 def tasks_list_tasks(
     tasklist_id: str = "@default",
     show_completed: bool = False,
@@ -362,16 +754,16 @@ def tasks_list_tasks(
             "position": task.get("position", "")
         })
 
-    return json.dumps(output, indent=2)
+    return _dump(output)
 
 
-@mcp.tool()
+@threaded_tool
 def tasks_get_task(task_id: str, tasklist_id: str = "@default", account: str = "personal") -> str:
     """Get a specific task by ID. Account can be 'personal', 'school', or 'work'."""
     tasks = get_tasks(account)
     task = tasks.tasks().get(tasklist=tasklist_id, task=task_id).execute()
 
-    return json.dumps({
+    return _dump({
         "id": task["id"],
         "title": task.get("title", ""),
         "status": task.get("status", ""),
@@ -380,10 +772,10 @@ def tasks_get_task(task_id: str, tasklist_id: str = "@default", account: str = "
         "completed": task.get("completed", ""),
         "parent": task.get("parent", ""),
         "links": task.get("links", [])
-    }, indent=2)
+    })
 
 
-@mcp.tool()
+@threaded_tool
 def tasks_create_task(
     title: str,
     tasklist_id: str = "@default",
@@ -402,24 +794,14 @@ def tasks_create_task(
 
     result = tasks.tasks().insert(tasklist=tasklist_id, body=task_body).execute()
 
-    return json.dumps({
+    return _dump({
         "id": result["id"],
         "title": result.get("title", ""),
         "selfLink": result.get("selfLink", "")
-    }, indent=2)
+    })
 
 
-@mcp.tool()
-def tasks_update_task(
-    task_id: str,
-    tasklist_id: str = "@default",
-    title: str = None,
-    notes: str = None,
-    due: str = None,
-    status: str = None,
-    account: str = "personal"
-) -> str:
-    """Update an existing task. Set status to 'completed' to mark as done, or 'needsAction' to mark as incomplete. Account can be 'personal', 'school', or 'work'."""
+def _update_task(task_id: str, tasklist_id: str, title: str, notes: str, due: str, status: str, account: str) -> str:
     tasks = get_tasks(account)
 
     # Get existing task
@@ -434,57 +816,123 @@ def tasks_update_task(
     if status:
         task["status"] = status
         if status == "completed":
-            from datetime import datetime, timezone
             task["completed"] = datetime.now(timezone.utc).isoformat()
         elif status == "needsAction":
             task.pop("completed", None)
 
     result = tasks.tasks().update(tasklist=tasklist_id, task=task_id, body=task).execute()
 
-    return json.dumps({
+    return _dump({
         "id": result["id"],
         "title": result.get("title", ""),
         "status": result.get("status", ""),
         "updated": result.get("updated", "")
-    }, indent=2)
+    })
+
+
+@threaded_tool
+def tasks_update_task(
+    task_id: str,
+    tasklist_id: str = "@default",
+    title: str = None,
+    notes: str = None,
+    due: str = None,
+    status: str = None,
+    account: str = "personal"
+) -> str:
+    """Update an existing task. Set status to 'completed' to mark as done, or 'needsAction' to mark as incomplete. Account can be 'personal', 'school', or 'work'."""
+    return _update_task(task_id, tasklist_id, title, notes, due, status, account)
 
 
-@mcp.tool()
+@threaded_tool
 def tasks_delete_task(task_id: str, tasklist_id: str = "@default", account: str = "personal") -> str:
     """Delete a task. Account can be 'personal', 'school', or 'work'."""
     tasks = get_tasks(account)
     tasks.tasks().delete(tasklist=tasklist_id, task=task_id).execute()
-    return json.dumps({"deleted": True, "task_id": task_id})
+    return _dump({"deleted": True, "task_id": task_id})
 
 
-@mcp.tool()
+@threaded_tool
 def tasks_complete_task(task_id: str, tasklist_id: str = "@default", account: str = "personal") -> str:
     """Mark a task as completed. Account can be 'personal', 'school', or 'work'."""
-    return tasks_update_task(task_id=task_id, tasklist_id=tasklist_id, status="completed", account=account)
+    return _update_task(task_id, tasklist_id, None, None, None, "completed", account)
 
 
-@mcp.tool()
+@threaded_tool
 def tasks_create_tasklist(title: str, account: str = "personal") -> str:
     """Create a new task list. Account can be 'personal', 'school', or 'work'."""
     tasks = get_tasks(account)
     result = tasks.tasklists().insert(body={"title": title}).execute()
 
-    return json.dumps({
+    return _dump({
         "id": result["id"],
         "title": result.get("title", ""),
         "selfLink": result.get("selfLink", "")
-    }, indent=2)
+    })
+
+
+# ============== Startup Warm-up ==============
+
+def _has_token(account: str) -> bool:
+    """Whether an account's token is available without running the interactive OAuth flow."""
+    if os.environ.get(ENV_TOKENS[account]):
+        return True
+    return os.environ.get("MCP_TRANSPORT") not in ("sse", "http") and ACCOUNTS[account].exists()
+
+
+def _warm(account: str) -> None:
+    """Load credentials, build the clients and open a connection so the first tool call starts warm."""
+    try:
+        get_calendar(account)
+        get_tasks(account)
+        get_gmail(account).users().getProfile(userId="me", fields="emailAddress").execute()
+    except Exception as e:
+        print(f"[DEBUG] Failed to warm up {account}: {e}", file=sys.stderr)
+
+
+def _start_warmup() -> None:
+    """Warm every account with an available token in the background. Called when a server process starts serving."""
+    for account in ACCOUNTS:
+        if _has_token(account):
+            threading.Thread(target=_warm, args=(account,), daemon=True).start()
+
+
+def create_stateless_http_app():
+    """App factory for running the HTTP transport under several uvicorn worker processes.
+
+    Each worker holds its own token cache, clients and connection pools. Sessions are
+    stateless so that any worker can serve any request. This does not hold for the
+    GitHub OAuth provider, which keeps its clients and tokens in process memory, so
+    multiple workers are only used when MCP OAuth is off.
+    """
+    _start_warmup()
+    return mcp.http_app(stateless_http=True)
 
 
 if __name__ == "__main__":
-    import sys
     # Use HTTP transport for remote deployment, stdio for local
     transport = os.environ.get("MCP_TRANSPORT", "stdio")
     if transport in ("sse", "http"):
         host = os.environ.get("HOST", "0.0.0.0")
         port = int(os.environ.get("PORT", "8000"))
+        workers = int(os.environ.get("WORKERS", "1"))
+        if workers > 1 and MCP_OAUTH_CLIENT_ID and MCP_OAUTH_CLIENT_SECRET:
+            # OAuth registrations and tokens live in one process's memory, so a flow can't span workers
+            print("WORKERS is ignored when MCP OAuth is enabled; running a single process", file=sys.stderr)
+            workers = 1
+        elif workers > 1 and transport == "sse":
+            # SSE sessions live in the process that opened them, so the stream and its POSTs can't span workers
+            print("WORKERS is ignored for the SSE transport; running a single process", file=sys.stderr)
+            workers = 1
         print(f"Starting MCP server on {host}:{port} with {transport} transport", flush=True)
         sys.stdout.flush()
-        mcp.run(transport=transport, host=host, port=port)
+        # SSE sessions live in the process that opened them, so only stateless HTTP can be spread over workers
+        if transport == "http" and workers > 1:
+            import uvicorn
+            uvicorn.run("main:create_stateless_http_app", factory=True, host=host, port=port, workers=workers)
+        else:
+            _start_warmup()
+            mcp.run(transport=transport, host=host, port=port)
     else:
+        _start_warmup()
         mcp.run()